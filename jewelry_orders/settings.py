@@ -64,19 +64,6 @@ INSTALLED_APPS = [
     'django_celery_beat',
 ]
 
-# REST Framework Configuration
-REST_FRAMEWORK = {
-    'DEFAULT_PERMISSION_CLASSES': [
-        'rest_framework.permissions.IsAuthenticated',
-    ],
-    'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework.authentication.SessionAuthentication',
-        'rest_framework.authentication.TokenAuthentication',
-    ],
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
-    'PAGE_SIZE': 20,
-}
-
 USE_S3 = os.environ.get('USE_S3', 'False').lower() == 'true'
 
 if USE_S3:
@@ -290,6 +277,25 @@ EMAIL_HOST_USER = config('EMAIL_HOST_USER',default='royalcraftjewelers@gmail.com
 EMAIL_HOST_PASSWORD = config('EMAIL_HOST_PASSWORD',default='ABC')
 DEFAULT_FROM_EMAIL = config('EMAIL_HOST_USER',default='royalcraftjewelers')
 
+# Cache Configuration
+# Set CACHE_URL (e.g. redis://localhost:6379/1) to share the cache across gunicorn
+# workers. Keep it off the Celery DB: RedisCache.clear() flushes the whole DB.
+CACHE_URL = config('CACHE_URL', default='')
+
+if CACHE_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': CACHE_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
 # Celery Configuration
 CELERY_BROKER_URL = config('REDIS_URL', default='redis://localhost:6379/0')
 CELERY_RESULT_BACKEND = config('REDIS_URL', default='redis://localhost:6379/0')
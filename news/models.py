@@ -30,3 +30,7 @@ class NewsItem(models.Model):
     read_by = models.ManyToManyField(User, blank=True, related_name='read_news_items')
     class Meta:
         ordering = ['-published_at']
+        indexes = [
+            # Visible-news filters and default ordering
+            models.Index(fields=['-published_at'], name='news_published_idx'),
+        ]
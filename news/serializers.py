@@ -19,6 +19,9 @@ class NewsItemListSerializer(serializers.ModelSerializer):
         ]
     
     def get_isRead(self, obj):
+        # NewsListView annotates is_read for authenticated users
+        if hasattr(obj, 'is_read'):
+            return obj.is_read
         user = self.context['request'].user
         if not user.is_authenticated:
             return False
@@ -1,6 +1,7 @@
 # news/views.py
+from datetime import date, datetime, time, timedelta
 from django.utils import timezone
-from django.db.models import Q
+from django.db.models import Exists, OuterRef, Q
 from rest_framework import generics, permissions, status
 from rest_framework.permissions import AllowAny
 from rest_framework.pagination import PageNumberPagination
@@ -8,12 +9,27 @@ from .models import NewsItem
 from .serializers import NewsItemListSerializer,NewsItemDetailSerializer
 from rest_framework.views import APIView
 from rest_framework.response import Response
+from rest_framework.exceptions import ValidationError
 
 class NewsPagination(PageNumberPagination):
     page_size = 10
     page_size_query_param = 'limit'
     max_page_size = 50
 
+def parse_date_param(value, param):
+    """Parse a YYYY-MM-DD query param, returning 400 on bad input"""
+    # fromisoformat also takes 20240101 and 2024-W01-1; only allow YYYY-MM-DD
+    if len(value) == 10 and value[4] == value[7] == '-':
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            pass
+    raise ValidationError({param: 'Date has wrong format. Use YYYY-MM-DD.'})
+
+def start_of_day(day):
+    """Timezone-aware midnight of `day`, for index-friendly range filters"""
+    return timezone.make_aware(datetime.combine(day, time.min))
+
 class NewsListView(generics.ListAPIView):
     serializer_class = NewsItemListSerializer
     permission_classes = [AllowAny]
@@ -30,6 +46,10 @@ class NewsListView(generics.ListAPIView):
             qs = qs.filter(
                 Q(is_public=True) | Q(target_user=user)
             )
+            # Read state in the same query instead of one lookup per item
+            qs = qs.annotate(is_read=Exists(
+                NewsItem.objects.filter(pk=OuterRef('pk'), read_by=user)
+            ))
         else:
             qs = qs.filter(is_public=True)
         # Filters
@@ -38,10 +58,15 @@ class NewsListView(generics.ListAPIView):
             qs = qs.filter(category=category)
         if priority := params.get('priority'):
             qs = qs.filter(priority=priority)
+        # Half-open datetime bounds instead of __date so published_at stays sargable
         if start := params.get('start_date'):
-            qs = qs.filter(published_at__date__gte=start)
+            start_day = parse_date_param(start, 'start_date')
+            qs = qs.filter(published_at__gte=start_of_day(start_day))
         if end := params.get('end_date'):
-            qs = qs.filter(published_at__date__lte=end)
+            end_day = parse_date_param(end, 'end_date')
+            # date.max has no next day; it bounds nothing, so skip the filter
+            if end_day < date.max:
+                qs = qs.filter(published_at__lt=start_of_day(end_day + timedelta(days=1)))
         if show := params.get('show_read'):
             show_read = show.lower() == 'true'
             if user.is_authenticated:
@@ -71,11 +96,11 @@ class NewsDetailView(generics.RetrieveAPIView):
         user = self.request.user
         now = timezone.now()
         qs = super().get_queryset().filter(published_at__lte=now).filter(
-            expires_at__gte=now) | super().get_queryset().filter(
-            published_at__lte=now, expires_at__isnull=True)
+            Q(expires_at__gte=now) | Q(expires_at__isnull=True)
+        )
         if user.is_authenticated:
             return qs.filter(
-                models.Q(is_public=True) | models.Q(target_user=user)
+                Q(is_public=True) | Q(target_user=user)
             )
         return qs.filter(is_public=True)
 
@@ -91,7 +116,7 @@ class MarkNewsReadView(APIView):
         
         # Only allow marking visible items
         now = timezone.now()
-        if not news.is_public and news.target_user != request.user:
+        if not news.is_public and news.target_user_id != request.user.id:
             return Response({'detail': 'Not found.'}, status=status.HTTP_404_NOT_FOUND)
         if news.published_at > now or (news.expires_at and news.expires_at < now):
             return Response({'detail': 'Not found.'}, status=status.HTTP_404_NOT_FOUND)
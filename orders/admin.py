@@ -7,10 +7,18 @@ class OrderFileInline(admin.TabularInline):
     extra = 0
     readonly_fields = ['uploaded_at']
 
+    def get_queryset(self, request):
+        # Each row's __str__ reads self.order
+        return super().get_queryset(request).select_related('order')
+
 class OrderLogInline(admin.TabularInline):
     model = OrderLog
     extra = 0
     readonly_fields = ['timestamp', 'user', 'action', 'changes']
+    
+    def get_queryset(self, request):
+        # Each row's __str__ reads self.order and self.user
+        return super().get_queryset(request).select_related('order', 'user')
 
 @admin.register(Order)
 class OrderAdmin(admin.ModelAdmin):
@@ -50,6 +58,7 @@ class OrderAdmin(admin.ModelAdmin):
 @admin.register(OrderFile)
 class OrderFileAdmin(admin.ModelAdmin):
     list_display = ['order', 'file_type', 'stage', 'caption', 'uploaded_at']
+    list_select_related = ['order']
     list_filter = ['file_type', 'stage', 'uploaded_at']
     search_fields = ['order__order_id', 'caption']
     readonly_fields = ['uploaded_at']
@@ -57,6 +66,7 @@ class OrderFileAdmin(admin.ModelAdmin):
 @admin.register(OrderLog)
 class OrderLogAdmin(admin.ModelAdmin):
     list_display = ['order', 'user', 'action', 'timestamp']
+    list_select_related = ['order', 'user']
     list_filter = ['timestamp', 'user']
     search_fields = ['order__order_id', 'action', 'user__username']
     readonly_fields = ['timestamp']
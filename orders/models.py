@@ -3,7 +3,6 @@ from django.db import models
 from django.contrib.auth import get_user_model
 import uuid
 from datetime import datetime
-from django.contrib.auth import get_user_model
 
 User = get_user_model()
 
@@ -39,6 +38,14 @@ class Order(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
     created_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name='created_orders')
     
+    class Meta:
+        indexes = [
+            # Admin order list filtered by status, newest first
+            models.Index(fields=['order_status', '-created_at'], name='orders_status_created_idx'),
+            # Customer order list / dashboard recent orders, newest first
+            models.Index(fields=['customer', '-created_at'], name='orders_customer_created_idx'),
+        ]
+    
     def save(self, *args, **kwargs):
         if not self.order_id:
             self.order_id = f"ORD{datetime.now().strftime('%Y%m%d')}{str(uuid.uuid4())[:6].upper()}"
@@ -73,6 +80,12 @@ class OrderLog(models.Model):
     changes = models.JSONField(default=dict)
     timestamp = models.DateTimeField(auto_now_add=True)
     
+    class Meta:
+        indexes = [
+            # order_logs: an order's history, newest first
+            models.Index(fields=['order', '-timestamp'], name='orderlog_order_ts_idx'),
+        ]
+    
     def __str__(self):
         return f"{self.order.order_id} - {self.action} by {self.user}"
 
@@ -125,6 +138,10 @@ class Contact(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # my_contact_requests: a user's tickets, newest first
+            models.Index(fields=['user', '-created_at'], name='contact_user_created_idx'),
+        ]
 
     def save(self, *args, **kwargs):
         if not self.ticket_number:
@@ -134,12 +151,12 @@ class Contact(models.Model):
             date_str = today.strftime('%Y%m%d')
             
             # Get the last ticket number for today
-            last_contact = Contact.objects.filter(
+            last_ticket = Contact.objects.filter(
                 ticket_number__startswith=f'CT{date_str}'
-            ).order_by('-ticket_number').first()
+            ).order_by('-ticket_number').values_list('ticket_number', flat=True).first()
             
-            if last_contact:
-                last_num = int(last_contact.ticket_number[-4:])
+            if last_ticket:
+                last_num = int(last_ticket[-4:])
                 next_num = last_num + 1
             else:
                 next_num = 1
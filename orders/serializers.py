@@ -5,6 +5,17 @@ from django.contrib.auth import get_user_model
 
 User = get_user_model()
 
+CURRENT_STAGE_MAPPING = {
+    'declined': 0,
+    'new': 1,
+    'confirmed': 2,
+    'cad_done': 3,
+    'rpt_done': 4,
+    'casting': 5,
+    'ready': 6,
+    'delivered': 7,
+}
+
 class OrderFileSerializer(serializers.ModelSerializer):
     fileType = serializers.CharField(source='file_type', read_only=True)
     uploadedAt = serializers.CharField(source='uploaded_at', read_only=True)
@@ -109,17 +120,7 @@ class OrderStatusSerializer(serializers.ModelSerializer):
         ]
 
     def get_currentStage(self, obj):
-        stage_mapping = {
-            'declined': 0,
-            'new': 1,
-            'confirmed': 2,
-            'cad_done': 3,
-            'rpt_done': 4,
-            'casting': 5,
-            'ready': 6,
-            'delivered': 7,
-        }
-        return stage_mapping.get(obj.order_status, 1)
+        return CURRENT_STAGE_MAPPING.get(obj.order_status, 1)
 
 # Admin serializers remain the same
 class OrderListSerializer(serializers.ModelSerializer):
@@ -165,7 +166,8 @@ class ContactSerializer(serializers.ModelSerializer):
         # Validate order_id exists if provided
         if data.get('order_id'):
             try:
-                Order.objects.get(order_id=data['order_id'])
+                # Keep the order so Contact.save() doesn't look it up again
+                data['related_order'] = Order.objects.get(order_id=data['order_id'])
             except Order.DoesNotExist:
                 raise serializers.ValidationError({
                     'order_id': 'Invalid order ID provided.'
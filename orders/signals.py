@@ -1,7 +1,9 @@
 # orders/signals.py
-from django.db.models.signals import post_save, pre_save
+from django.db.models.signals import post_save, pre_save, post_delete
 from django.dispatch import receiver
 from django.db import transaction
+from django.core.cache import cache
+from users.cache import get_dashboard_cache_key
 from .models import Order
 from .tasks import send_order_completion_email, send_order_status_update_email
 import logging
@@ -10,15 +12,14 @@ logger = logging.getLogger(__name__)
 
 @receiver(pre_save, sender=Order)
 def capture_old_status(sender, instance, **kwargs):
-    """Capture the old status before saving"""
+    """Capture the old status and customer before saving"""
+    old_row = None
     if instance.pk:
-        try:
-            old_instance = Order.objects.get(pk=instance.pk)
-            instance._old_status = old_instance.order_status
-        except Order.DoesNotExist:
-            instance._old_status = None
-    else:
-        instance._old_status = None
+        # Only the two columns we need; None if the row is gone
+        old_row = Order.objects.filter(
+            pk=instance.pk
+        ).values_list('order_status', 'customer_id').first()
+    instance._old_status, instance._old_customer_id = old_row or (None, None)
 
 @receiver(post_save, sender=Order)
 def send_order_notification_email(sender, instance, created, **kwargs):
@@ -37,6 +38,17 @@ def send_order_notification_email(sender, instance, created, **kwargs):
         # Schedule email task to run after transaction commits
         transaction.on_commit(lambda: handle_status_change_email(instance, old_status, new_status))
 
+@receiver([post_save, post_delete], sender=Order)
+def clear_customer_dashboard_cache(sender, instance, **kwargs):
+    """Drop the cached dashboard statistics of the order's customer(s)"""
+    customer_ids = {instance.customer_id}
+    # An order moved to another customer also changes the previous one's dashboard
+    old_customer_id = getattr(instance, '_old_customer_id', None)
+    if old_customer_id is not None:
+        customer_ids.add(old_customer_id)
+    cache_keys = [get_dashboard_cache_key(customer_id) for customer_id in customer_ids]
+    transaction.on_commit(lambda: cache.delete_many(cache_keys))
+
 def handle_status_change_email(instance, old_status, new_status):
     """Handle email sending based on status change"""
     
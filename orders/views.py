@@ -88,7 +88,8 @@ class OrderListView(generics.ListAPIView):
         if not is_admin_user(self.request.user):
             return Order.objects.none()
         
-        queryset = Order.objects.all().order_by('-created_at')
+        # customer is read by OrderListSerializer.customer_name
+        queryset = Order.objects.select_related('customer').order_by('-created_at')
         
         # Search functionality
         search = self.request.query_params.get('search', None)
@@ -220,7 +221,12 @@ def order_logs(request, order_id):
         return Response({'error': 'Admin access required'}, status=status.HTTP_403_FORBIDDEN)
         
     order = get_object_or_404(Order, order_id=order_id)
-    logs = OrderLog.objects.filter(order=order).order_by('-timestamp')
+    logs = (
+        OrderLog.objects.filter(order=order)
+        .select_related('user')
+        .only('action', 'changes', 'timestamp', 'user', 'user__username')
+        .order_by('-timestamp')
+    )
     serializer = OrderLogSerializer(logs, many=True)
     return Response(serializer.data)
 
@@ -287,6 +293,7 @@ def contact_us(request):
             preferred_contact_method=contact_data['preferred_contact_method'],
             order_related=contact_data.get('order_related', False),
             order_id=contact_data.get('order_id', None),
+            related_order=contact_data.get('related_order', None),
         )
         
         # Serialize response
@@ -326,21 +333,25 @@ def my_contact_requests(request):
             status=status.HTTP_401_UNAUTHORIZED
         )
     
-    contacts = Contact.objects.filter(user=request.user)
+    # Only fetch the columns we list (skips message and model instantiation)
+    contacts = Contact.objects.filter(user=request.user).values(
+        'id', 'ticket_number', 'subject', 'status', 'order_related',
+        'order_id', 'created_at', 'admin_response', 'responded_at'
+    )
     
     # Simple serialization for listing
     data = []
     for contact in contacts:
         data.append({
-            'id': str(contact.id),
-            'ticket_number': contact.ticket_number,
-            'subject': contact.subject,
-            'status': contact.status,
-            'order_related': contact.order_related,
-            'order_id': contact.order_id,
-            'created_at': contact.created_at.isoformat(),
-            'admin_response': contact.admin_response,
-            'responded_at': contact.responded_at.isoformat() if contact.responded_at else None,
+            'id': str(contact['id']),
+            'ticket_number': contact['ticket_number'],
+            'subject': contact['subject'],
+            'status': contact['status'],
+            'order_related': contact['order_related'],
+            'order_id': contact['order_id'],
+            'created_at': contact['created_at'].isoformat(),
+            'admin_response': contact['admin_response'],
+            'responded_at': contact['responded_at'].isoformat() if contact['responded_at'] else None,
         })
     
     return Response(data, status=status.HTTP_200_OK)
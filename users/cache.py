@@ -0,0 +1,6 @@
+# users/cache.py
+DASHBOARD_CACHE_TIMEOUT = 60  # seconds
+
+def get_dashboard_cache_key(user_id):
+    """Cache key for a customer's dashboard order statistics"""
+    return f'customer_dashboard:{user_id}'
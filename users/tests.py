@@ -1,3 +1,60 @@
-from django.test import TestCase
+from datetime import date
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from orders.models import Order
+from .cache import get_dashboard_cache_key
+
+User = get_user_model()
+
+
+@override_settings(CACHES={
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}
+})
+class DashboardCacheInvalidationTests(TestCase):
+    """Order save/delete signals drop the affected customers' dashboard cache"""
+
+    def setUp(self):
+        cache.clear()
+        self.alice = User.objects.create_user(username='alice', password='pass')
+        self.bob = User.objects.create_user(username='bob', password='pass')
+        self.order = Order.objects.create(
+            client_id=self.alice.client_id,
+            customer=self.alice,
+            full_name='Alice',
+            contact_number='1234567890',
+            email='alice@example.com',
+            description='Ring',
+            preferred_delivery_date=date(2030, 1, 1),
+        )
+        self.alice_key = get_dashboard_cache_key(self.alice.id)
+        self.bob_key = get_dashboard_cache_key(self.bob.id)
+        cache.set_many({self.alice_key: 'cached', self.bob_key: 'cached'})
+
+    def test_save_clears_customer_key_on_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.order.description = 'Ring with diamond'
+            self.order.save()
+            # Nothing is cleared until the transaction commits
+            self.assertEqual(cache.get(self.alice_key), 'cached')
+
+        self.assertIsNone(cache.get(self.alice_key))
+        self.assertEqual(cache.get(self.bob_key), 'cached')
+
+    def test_reassign_clears_old_and_new_customer_keys(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.order.customer = self.bob
+            self.order.save()
+
+        self.assertIsNone(cache.get(self.alice_key))
+        self.assertIsNone(cache.get(self.bob_key))
+
+    def test_delete_clears_customer_key_on_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.order.delete()
+            self.assertEqual(cache.get(self.alice_key), 'cached')
+
+        self.assertIsNone(cache.get(self.alice_key))
+        self.assertEqual(cache.get(self.bob_key), 'cached')
@@ -6,8 +6,10 @@ from rest_framework.response import Response
 from rest_framework.authtoken.models import Token
 from django.contrib.auth import authenticate
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.db.models import Count, Q
 from orders.models import Order
+from .cache import DASHBOARD_CACHE_TIMEOUT, get_dashboard_cache_key
 from .serializers import (
     UserRegistrationSerializer, 
     UserLoginSerializer, 
@@ -17,9 +19,18 @@ from .serializers import (
 from dj_rest_auth.registration.views import SocialLoginView
 from allauth.socialaccount.providers.google.views import GoogleOAuth2Adapter
 from allauth.socialaccount.providers.oauth2.client import OAuth2Client
-from .serializers import UserDetailSerializer
 User = get_user_model()
 
+ORDER_STAGE_MAPPING = {
+    'new': 1,
+    'cad_done': 2,
+    'rpt_done': 3,
+    'casting': 4,
+    'ready': 5,
+    'delivered': 6,
+    'declined': 0
+}
+
 class UserRegistrationView(generics.CreateAPIView):
     serializer_class = UserRegistrationSerializer
     permission_classes = [AllowAny]
@@ -90,6 +101,27 @@ def customer_dashboard(request):
     """
     user = request.user
     
+    # Order statistics are cached per customer (see CACHES in settings)
+    # and cleared by the Order save/delete signals in orders/signals.py
+    cache_key = get_dashboard_cache_key(user.id)
+    order_data = cache.get(cache_key)
+    if order_data is None:
+        order_data = get_dashboard_order_data(user)
+        cache.set(cache_key, order_data, DASHBOARD_CACHE_TIMEOUT)
+    
+    # User profile data
+    user_serializer = UserDetailSerializer(user)
+    
+    dashboard_data = {
+        'user': user_serializer.data,
+        'client_id': user.client_id,
+        **order_data
+    }
+    
+    return Response(dashboard_data, status=status.HTTP_200_OK)
+
+def get_dashboard_order_data(user):
+    """Build the order statistics, recent orders and quick stats of the dashboard"""
     # Get user's orders
     user_orders = Order.objects.filter(customer=user)
     
@@ -105,39 +137,39 @@ def customer_dashboard(request):
         declined_orders=Count('id', filter=Q(order_status='declined'))
     )
     
-    # Get recent orders (last 5)
-    recent_orders = user_orders.order_by('-created_at')[:5]
+    # Get recent orders (last 5), selecting only the columns we return
+    recent_orders = user_orders.order_by('-created_at').values(
+        'order_id', 'client_id', 'full_name', 'order_status',
+        'created_at', 'preferred_delivery_date', 'estimated_value'
+    )[:5]
     recent_orders_data = []
     
     for order in recent_orders:
         recent_orders_data.append({
-            'order_id': order.order_id,
-            'client_id': order.client_id,
-            'full_name': order.full_name,
-            'order_status': order.order_status,
-            'created_at': order.created_at,
-            'preferred_delivery_date': order.preferred_delivery_date,
-            'estimated_value': str(order.estimated_value),
-            'current_stage': get_order_stage(order.order_status)
+            'order_id': order['order_id'],
+            'client_id': order['client_id'],
+            'full_name': order['full_name'],
+            'order_status': order['order_status'],
+            'created_at': order['created_at'],
+            'preferred_delivery_date': order['preferred_delivery_date'],
+            'estimated_value': str(order['estimated_value']),
+            'current_stage': get_order_stage(order['order_status'])
         })
     
-    # Get orders by status for quick access
+    # Get orders by status for quick access (derived from the aggregate above)
     orders_by_status = {
-        'new': user_orders.filter(order_status='new').count(),
-        'in_progress': user_orders.filter(
-            order_status__in=['cad_done', 'rpt_done', 'casting']
-        ).count(),
-        'ready': user_orders.filter(order_status='ready').count(),
-        'delivered': user_orders.filter(order_status='delivered').count(),
-        'declined': user_orders.filter(order_status='declined').count()
+        'new': order_stats['new_orders'],
+        'in_progress': (
+            order_stats['cad_done_orders'] +
+            order_stats['rpt_done_orders'] +
+            order_stats['casting_orders']
+        ),
+        'ready': order_stats['ready_orders'],
+        'delivered': order_stats['delivered_orders'],
+        'declined': order_stats['declined_orders']
     }
     
-    # User profile data
-    user_serializer = UserDetailSerializer(user)
-    
-    dashboard_data = {
-        'user': user_serializer.data,
-        'client_id': user.client_id,
+    return {
         'statistics': {
             'total_orders': order_stats['total_orders'] or 0,
             'orders_by_status': orders_by_status,
@@ -158,21 +190,10 @@ def customer_dashboard(request):
             'ready_for_pickup': orders_by_status['ready']
         }
     }
-    
-    return Response(dashboard_data, status=status.HTTP_200_OK)
 
 def get_order_stage(order_status):
     """Helper function to get order stage number"""
-    stage_mapping = {
-        'new': 1,
-        'cad_done': 2,
-        'rpt_done': 3,
-        'casting': 4,
-        'ready': 5,
-        'delivered': 6,
-        'declined': 0
-    }
-    return stage_mapping.get(order_status, 1)
+    return ORDER_STAGE_MAPPING.get(order_status, 1)
 
 class UserProfileView(generics.RetrieveUpdateAPIView):
     serializer_class = UserProfileSerializer